@@ -2,16 +2,33 @@
 """The Easun ISolar Inverter integration."""
 from __future__ import annotations
 import asyncio
+import contextlib
+import json
 import logging
+from datetime import datetime
+from itertools import count
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
+
+from easunpy.modbusclient import create_request, decode_modbus_response
 
 _LOGGER = logging.getLogger(__name__)
 DOMAIN = "easun_inverter"
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+# Cap on concurrent in-flight scan probes, to avoid overwhelming the inverter.
+SCAN_CONCURRENCY = 16
+# Modbus function code 0x03 allows at most 125 registers per request.
+MAX_REGISTERS_PER_READ = 125
+# Scans probe units and registers that may legitimately never answer, so a
+# miss must fail fast: one attempt with a short read timeout, and no session
+# teardown (which would cost the live coordinator a full UDP rediscovery per
+# silent unit while the scan holds the client lock).
+SCAN_RETRY_COUNT = 1
+SCAN_READ_TIMEOUT = 1.5
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Easun ISolar Inverter from a config entry."""
     _LOGGER.warning(
@@ -22,6 +39,203 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Forward the setup to the sensor platform.
     # The sensor platform will create the inverter object and coordinator.
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # The sensor platform stores its objects only after the first successful
+    # refresh. If that refresh failed (inverter unreachable at startup) the
+    # platform retries in the background and there is nothing to wire the
+    # services to yet; skip them rather than crash the entry setup.
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is None:
+        _LOGGER.debug("Platform setup deferred; skipping service registration")
+        return True
+
+    # Both scan services share the inverter's persistent AsyncModbusClient:
+    # it already holds one reader/writer pair and serializes frames with an
+    # internal lock, so concurrent probes reuse a single TCP connection
+    # instead of opening and closing a socket per request. ASCII inverters
+    # have no such session, so the raw-frame services are Modbus-only.
+    client = entry_data["inverter"].client
+    is_modbus = hasattr(client, "send_bulk")
+    if is_modbus:
+        entry_data["modbus_session"] = client
+
+    # One lock covers both scan services; `.locked()` gives an atomic
+    # non-blocking check with no separate "is_scanning" flag to race against.
+    scan_lock = asyncio.Lock()
+
+    # Scan frames carry unique transaction ids so the client can discard the
+    # late reply of a slow responder instead of attributing it to the next
+    # probe on the same connection.
+    scan_tid = count(0x0700)
+
+    async def async_single_request(request: bytes) -> bytes:
+        """Send a single Modbus frame through the shared session, failing fast."""
+        responses = await entry_data["modbus_session"].send_bulk(
+            [request],
+            retry_count=SCAN_RETRY_COUNT,
+            read_timeout=SCAN_READ_TIMEOUT,
+            cleanup_on_timeout=False,
+        )
+        return responses[0] if responses else b""
+
+    async def handle_device_scan(call: ServiceCall) -> None:
+        """Scan a range of Modbus device IDs concurrently."""
+        if scan_lock.locked():
+            _LOGGER.warning("A scan is already running; ignoring device_scan call")
+            return
+
+        start_id = int(call.data.get("start_id", 0))
+        end_id = int(call.data.get("end_id", 255))
+
+        semaphore = asyncio.Semaphore(SCAN_CONCURRENCY)
+        # Pre-sized list indexed by offset so gather preserves ordering without locks.
+        results: list[dict] = [None] * (end_id - start_id + 1)
+        # Probes run at full rate while the inverter answers; only failures
+        # trigger an exponential backoff (reset on the next valid response).
+        backoff = 1
+        valid_count = 0
+
+        # The probe frame differs per device only in the unit-ID byte, but
+        # that byte participates in the Modbus CRC, so a byte-patched
+        # template would corrupt the frame. Encode all frames up front in
+        # one tight loop instead of re-encoding inside each probe coroutine.
+        probe_requests = {
+            device_id: create_request(next(scan_tid) & 0xFFFF, 0x0001, device_id, 0x03, 0x0000, 1)
+            for device_id in range(start_id, end_id + 1)
+        }
+
+        async def probe(device_id: int) -> None:
+            nonlocal backoff, valid_count
+            async with semaphore:
+                request = probe_requests[device_id]
+                try:
+                    response = await async_single_request(request)
+                except Exception as e:
+                    _LOGGER.debug("Device ID 0x%02x probe failed: %s", device_id, e)
+                    response = b""
+                results[device_id - start_id] = {
+                    "device_id": device_id,
+                    "response": response.hex(),
+                    "status": "Valid Response" if response else "No Response",
+                }
+                if response:
+                    backoff = 1
+                    valid_count += 1
+                else:
+                    await asyncio.sleep(0.05 * backoff)
+                    backoff = min(backoff * 2, 16)
+
+        _LOGGER.info("Starting device ID scan from %d to %d", start_id, end_id)
+        async with scan_lock:
+            await asyncio.gather(*(probe(device_id) for device_id in range(start_id, end_id + 1)))
+
+        scan_data = {
+            "timestamp": datetime.now().isoformat(),
+            "start_id": start_id,
+            "end_id": end_id,
+            "results": results,
+        }
+        # Serialize once here in the producer; consumers read the cached
+        # string instead of re-dumping the dict on every poll.
+        entry_data["device_scan"] = scan_data
+        entry_data["device_scan_json"] = json.dumps(scan_data)
+
+        _LOGGER.info(
+            "Device scan complete: %d of %d IDs responded", valid_count, len(results)
+        )
+
+    async def read_register_chunk(chunk_start: int, chunk_size: int) -> list[dict]:
+        """Read a contiguous chunk of registers, bisecting on failure."""
+        # Unit 0x00 matches the live poll path; some inverters only answer
+        # that unit and would leave every chunk silent on 0x01.
+        request = create_request(next(scan_tid) & 0xFFFF, 0x0001, 0x00, 0x03, chunk_start, chunk_size)
+        try:
+            response = await async_single_request(request)
+            if response:
+                decoded = decode_modbus_response(response, chunk_size)
+                return [
+                    {"register": chunk_start + i, "value": value}
+                    for i, value in enumerate(decoded)
+                ]
+        except Exception as e:
+            _LOGGER.debug("Register chunk %d (+%d) failed: %s", chunk_start, chunk_size, e)
+        if chunk_size == 1:
+            return [{"register": chunk_start, "value": None}]
+        # A wide read can fail because of one unsupported register in the
+        # range; halve the chunk instead of pre-fragmenting every scan.
+        half = chunk_size // 2
+        lower = await read_register_chunk(chunk_start, half)
+        upper = await read_register_chunk(chunk_start + half, chunk_size - half)
+        return lower + upper
+
+    async def handle_register_scan(call: ServiceCall) -> None:
+        """Scan a contiguous range of Modbus registers."""
+        if scan_lock.locked():
+            _LOGGER.warning("A scan is already running; ignoring register_scan call")
+            return
+
+        start_register = int(call.data.get("start_register", 0))
+        register_count = int(call.data.get("register_count", 100))
+
+        _LOGGER.info(
+            "Starting register scan from %d (%d registers)", start_register, register_count
+        )
+        results: list[dict] = []
+        valid_count = 0
+        # Read the largest contiguous chunks the protocol permits instead of
+        # many small fixed-size requests.
+        scan_end = start_register + register_count
+        chunks = [
+            (chunk_start, min(MAX_REGISTERS_PER_READ, scan_end - chunk_start))
+            for chunk_start in range(start_register, scan_end, MAX_REGISTERS_PER_READ)
+        ]
+
+        # Chunks are independent reads, so gather them; a small semaphore
+        # keeps the inverter's Modbus queue from flooding, and gather's
+        # in-order join keeps the assembled results sorted by register.
+        chunk_semaphore = asyncio.Semaphore(4)
+
+        async def bounded_chunk(chunk_start: int, chunk_size: int) -> list[dict]:
+            async with chunk_semaphore:
+                return await read_register_chunk(chunk_start, chunk_size)
+
+        async with scan_lock:
+            chunk_results = await asyncio.gather(
+                *(bounded_chunk(chunk_start, chunk_size) for chunk_start, chunk_size in chunks)
+            )
+        for chunk in chunk_results:
+            valid_count += sum(1 for r in chunk if r["value"] is not None)
+            results.extend(chunk)
+
+        scan_data = {
+            "timestamp": datetime.now().isoformat(),
+            "start_register": start_register,
+            "register_count": register_count,
+            "results": results,
+        }
+        entry_data["register_scan"] = scan_data
+        entry_data["register_scan_json"] = json.dumps(scan_data)
+
+        _LOGGER.info(
+            "Register scan complete: %d of %d registers readable",
+            valid_count, len(results),
+        )
+
+    async def handle_refresh(call: ServiceCall) -> None:
+        """Trigger an immediate coordinator poll on demand.
+
+        Lets users keep a relaxed scan_interval and still force a fresh
+        read when they need one; the coordinator's debouncer coalesces
+        rapid repeat calls into a single poll.
+        """
+        await entry_data["coordinator"].async_request_refresh()
+
+    if is_modbus:
+        hass.services.async_register(DOMAIN, "device_scan", handle_device_scan)
+        hass.services.async_register(DOMAIN, "register_scan", handle_register_scan)
+    else:
+        _LOGGER.debug("ASCII inverter: raw Modbus scan services not registered")
+    hass.services.async_register(DOMAIN, "refresh", handle_refresh)
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -38,11 +252,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             inverter = entry_data["inverter"]
             # For ASCII models, we need to explicitly disconnect to release the port
             if hasattr(inverter, "client") and hasattr(inverter.client, "disconnect"):
-                try:
-                    _LOGGER.info("Disconnecting from ASCII inverter to release port.")
-                    # Create a task to run the disconnect coroutine
-                    await asyncio.create_task(inverter.client.disconnect())
-                except Exception as e:
-                    _LOGGER.error("Error during inverter disconnect: %s", e)
+                _LOGGER.info("Disconnecting from ASCII inverter to release port.")
+                # Suppress only transport errors; CancelledError must keep
+                # propagating so HA can shut down cleanly.
+                with contextlib.suppress(OSError, ConnectionError):
+                    await inverter.client.disconnect()
     
     return unload_ok
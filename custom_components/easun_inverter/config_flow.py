@@ -2,6 +2,7 @@
 """Config flow for Easun Inverter integration."""
 from __future__ import annotations
 
+import asyncio
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
@@ -15,6 +16,11 @@ from easunpy.models import MODEL_CONFIGS
 DEFAULT_SCAN_INTERVAL = 30
 _LOGGER = logging.getLogger(__name__)
 
+# Model list is static for the lifetime of the process; compute it once
+# (ASCII model first) instead of rebuilding it on every flow step.
+AVAILABLE_MODELS = ("VOLTRONIC_ASCII", *(m for m in MODEL_CONFIGS if m != "VOLTRONIC_ASCII"))
+MODEL_LIST_STR = ", ".join(AVAILABLE_MODELS)
+
 class EasunInverterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Easun Inverter."""
 
@@ -49,18 +55,27 @@ class EasunInverterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data=entry_data,
                 )
 
-        inverter_ip = await self.hass.async_add_executor_job(discover_device)
-        local_ip = await self.hass.async_add_executor_job(get_local_ip)
-
-        # Get available models, with the new ASCII model first
-        available_models = ["VOLTRONIC_ASCII"] + [m for m in MODEL_CONFIGS.keys() if m != "VOLTRONIC_ASCII"]
+        # Both probes are independent network lookups; run them concurrently
+        # so the wait is max(discover, local_ip) instead of their sum. Either
+        # one failing just leaves its form field empty.
+        inverter_ip, local_ip = await asyncio.gather(
+            self.hass.async_add_executor_job(discover_device),
+            self.hass.async_add_executor_job(get_local_ip),
+            return_exceptions=True,
+        )
+        if isinstance(inverter_ip, BaseException):
+            _LOGGER.debug("Inverter discovery failed: %s", inverter_ip)
+            inverter_ip = None
+        if isinstance(local_ip, BaseException):
+            _LOGGER.debug("Local IP detection failed: %s", local_ip)
+            local_ip = None
 
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema({
                 vol.Required("inverter_ip", default=inverter_ip or ""): str,
                 vol.Required("local_ip", default=local_ip or ""): str,
-                vol.Required("model", default="VOLTRONIC_ASCII"): vol.In(available_models),
+                vol.Required("model", default="VOLTRONIC_ASCII"): vol.In(AVAILABLE_MODELS),
                 vol.Optional("scan_interval", default=DEFAULT_SCAN_INTERVAL): vol.All(
                     vol.Coerce(int),
                     vol.Range(min=5, max=3600)
@@ -68,7 +83,7 @@ class EasunInverterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             }),
             errors=errors,
             description_placeholders={
-                "model_list": ", ".join(available_models)
+                "model_list": MODEL_LIST_STR
             }
         )
 
@@ -89,14 +104,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
 
         current_data = self.config_entry.data
-        available_models = ["VOLTRONIC_ASCII"] + [m for m in MODEL_CONFIGS.keys() if m != "VOLTRONIC_ASCII"]
 
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema({
                 vol.Required("inverter_ip", default=current_data.get("inverter_ip")): str,
                 vol.Required("local_ip", default=current_data.get("local_ip")): str,
-                vol.Required("model", default=current_data.get("model")): vol.In(available_models),
+                vol.Required("model", default=current_data.get("model")): vol.In(AVAILABLE_MODELS),
                 vol.Optional(
                     "scan_interval",
                     default=self.config_entry.options.get("scan_interval", current_data.get("scan_interval", DEFAULT_SCAN_INTERVAL))
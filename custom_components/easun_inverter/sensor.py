@@ -1,8 +1,14 @@
 # custom_components/easun_inverter/sensor.py
+import asyncio
 from datetime import timedelta
 import logging
+from operator import attrgetter
 
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorDeviceClass,
+    SensorStateClass,
+)
 from homeassistant.const import (
     UnitOfPower, UnitOfElectricCurrent, UnitOfElectricPotential,
     UnitOfTemperature, UnitOfFrequency, UnitOfApparentPower,
@@ -11,6 +17,7 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from . import DOMAIN
@@ -18,6 +25,66 @@ from easunpy import get_inverter
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on a single poll; generous enough for the client's own retries.
+UPDATE_TIMEOUT = 60
+# Rating data is static device configuration; refresh it rarely.
+RATING_UPDATE_INTERVAL = timedelta(minutes=10)
+
+
+def _join_warnings(value):
+    """Render the warnings list as a readable state string."""
+    return ", ".join(value) if value else "None"
+
+
+# Position of each data type inside the coordinator's data tuple. Module
+# scope so setup does not rebuild it per entry; the entity itself stores
+# only the resolved index.
+_DATA_INDEX = {"battery": 0, "pv": 1, "grid": 2, "output": 3, "system": 4, "rating": 5}
+
+# Static sensor definitions, built once per process instead of per entry:
+# (id_suffix, name, unit, data_type, data_attr, device_class, state_class, icon, converter)
+SENSOR_SPECS: tuple[tuple, ...] = (
+    # Battery Sensors
+    ("battery_voltage", "Battery Voltage", UnitOfElectricPotential.VOLT, "battery", "voltage", SensorDeviceClass.VOLTAGE, SensorStateClass.MEASUREMENT, None, None),
+    ("battery_current", "Battery Current", UnitOfElectricCurrent.AMPERE, "battery", "current", SensorDeviceClass.CURRENT, SensorStateClass.MEASUREMENT, None, None),
+    ("battery_power", "Battery Power", UnitOfPower.WATT, "battery", "power", SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, None, None),
+    ("battery_soc", "Battery SOC", PERCENTAGE, "battery", "soc", SensorDeviceClass.BATTERY, SensorStateClass.MEASUREMENT, None, None),
+    ("inverter_temperature", "Inverter Temperature", UnitOfTemperature.CELSIUS, "battery", "temperature", SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT, None, None),
+
+    # PV Sensors
+    ("pv_total_power", "PV Total Power", UnitOfPower.WATT, "pv", "total_power", SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, None, None),
+    ("pv1_voltage", "PV1 Voltage", UnitOfElectricPotential.VOLT, "pv", "pv1_voltage", SensorDeviceClass.VOLTAGE, SensorStateClass.MEASUREMENT, None, None),
+    ("pv1_current", "PV1 Current", UnitOfElectricCurrent.AMPERE, "pv", "pv1_current", SensorDeviceClass.CURRENT, SensorStateClass.MEASUREMENT, None, None),
+    ("pv1_power", "PV1 Power", UnitOfPower.WATT, "pv", "pv1_power", SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, None, None),
+    ("pv2_voltage", "PV2 Voltage", UnitOfElectricPotential.VOLT, "pv", "pv2_voltage", SensorDeviceClass.VOLTAGE, SensorStateClass.MEASUREMENT, None, None),
+    ("pv2_current", "PV2 Current", UnitOfElectricCurrent.AMPERE, "pv", "pv2_current", SensorDeviceClass.CURRENT, SensorStateClass.MEASUREMENT, None, None),
+    ("pv2_power", "PV2 Power", UnitOfPower.WATT, "pv", "pv2_power", SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, None, None),
+
+    # Grid and Output Sensors
+    ("grid_voltage", "Grid Voltage", UnitOfElectricPotential.VOLT, "grid", "voltage", SensorDeviceClass.VOLTAGE, SensorStateClass.MEASUREMENT, None, None),
+    ("grid_frequency", "Grid Frequency", UnitOfFrequency.HERTZ, "grid", "frequency", SensorDeviceClass.FREQUENCY, SensorStateClass.MEASUREMENT, None, None),
+    ("output_power", "Output Power", UnitOfPower.WATT, "output", "power", SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT, None, None),
+    ("output_apparent_power", "Output Apparent Power", UnitOfApparentPower.VOLT_AMPERE, "output", "apparent_power", SensorDeviceClass.APPARENT_POWER, SensorStateClass.MEASUREMENT, None, None),
+    ("output_load_percentage", "Output Load", PERCENTAGE, "output", "load_percentage", None, SensorStateClass.MEASUREMENT, "mdi:percent", None),
+
+    # System Status Sensors
+    ("operating_mode", "Operating Mode", None, "system", "mode_name", None, None, "mdi:power-settings", None),
+    ("warnings", "Device Warnings", None, "system", "warnings", None, None, "mdi:alert-outline", _join_warnings),
+
+    # Rating Sensors (static data)
+    ("rating_battery_type", "Rating Battery Type", None, "rating", "battery_type", None, None, "mdi:car-battery", None),
+    ("rating_max_charge_current", "Rating Max Charge Current", UnitOfElectricCurrent.AMPERE, "rating", "max_charging_current", SensorDeviceClass.CURRENT, None, None, None),
+    ("rating_max_ac_charge_current", "Rating Max AC Charge Current", UnitOfElectricCurrent.AMPERE, "rating", "max_ac_charging_current", SensorDeviceClass.CURRENT, None, None, None),
+    ("rating_output_priority", "Rating Output Priority", None, "rating", "output_source_priority", None, None, "mdi:source-commit", None),
+    ("rating_charger_priority", "Rating Charger Priority", None, "rating", "charger_source_priority", None, None, "mdi:source-commit-next-local", None),
+    ("rating_ac_output_voltage", "Rating AC Output Voltage", UnitOfElectricPotential.VOLT, "rating", "ac_output_rating_voltage", SensorDeviceClass.VOLTAGE, None, None, None),
+    ("rating_battery_float_v", "Rating Battery Float Voltage", UnitOfElectricPotential.VOLT, "rating", "battery_float_voltage", SensorDeviceClass.VOLTAGE, None, None, None),
+    ("rating_battery_bulk_v", "Rating Battery Bulk Voltage", UnitOfElectricPotential.VOLT, "rating", "battery_bulk_voltage", SensorDeviceClass.VOLTAGE, None, None, None),
+    ("rating_battery_recharge_v", "Rating Battery Recharge Voltage", UnitOfElectricPotential.VOLT, "rating", "battery_recharge_voltage", SensorDeviceClass.VOLTAGE, None, None, None),
+    ("rating_battery_under_v", "Rating Battery Under Voltage", UnitOfElectricPotential.VOLT, "rating", "battery_under_voltage", SensorDeviceClass.VOLTAGE, None, None, None),
+    ("rating_ac_output_power", "Rating AC Output Power", UnitOfPower.WATT, "rating", "ac_output_rating_active_power", SensorDeviceClass.POWER, None, None, None),
+)
+
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, add_entities: AddEntitiesCallback) -> None:
     """Set up the Easun Inverter sensors from a config entry."""
     inverter = get_inverter(
@@ -26,10 +93,20 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, add_
         local_ip=config_entry.data["local_ip"]
     )
 
+    # ASCII inverters expose a live/rating split so the static QPIRI rating
+    # data can be polled on a much slower cadence; Modbus models have no
+    # rating data and keep using get_all_data.
+    fetch_live = getattr(inverter, "get_live_data", inverter.get_all_data)
+
     async def async_update_data():
         """Fetch data from inverter."""
         try:
-            return await inverter.get_all_data()
+            # asyncio.timeout is a plain cancel scope: no wrapper Task is
+            # allocated per poll, unlike create_task + wait_for.
+            async with asyncio.timeout(UPDATE_TIMEOUT):
+                return await fetch_live()
+        except TimeoutError as err:
+            raise UpdateFailed("Timed out waiting for inverter data") from err
         except Exception as err:
             raise UpdateFailed(f"Error communicating with inverter: {err}") from err
 
@@ -37,108 +114,174 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, add_
         hass, _LOGGER, name=f"easun_inverter_{config_entry.entry_id}",
         update_method=async_update_data,
         update_interval=timedelta(seconds=config_entry.options.get("scan_interval", 30)),
+        # The returned dataclass tuple compares field-wise, so skip firing
+        # listeners entirely when a poll brings back identical data.
+        always_update=False,
+        # Coalesce bursts of refresh requests so an aggressive scan_interval
+        # (or repeated service calls) cannot flood the inverter or recorder.
+        request_refresh_debouncer=Debouncer(hass, _LOGGER, cooldown=0.5, immediate=True),
     )
     
     await coordinator.async_config_entry_first_refresh()
-    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = {"coordinator": coordinator, "inverter": inverter}
-    
-    data_map = {"battery": 0, "pv": 1, "grid": 2, "output": 3, "system": 4, "rating": 5}
-
-    # Corrected the function signature to include 'converter'
-    def s(id, name, unit, type, attr, dc=None, icon=None, converter=None):
-        """Helper to create sensor definitions."""
-        return EasunSensor(coordinator, id, name, unit, type, attr, data_map.get(type), dc, icon, converter)
-
-    sensors_to_add = [
-        # Battery Sensors
-        s("battery_voltage", "Battery Voltage", UnitOfElectricPotential.VOLT, "battery", "voltage", SensorDeviceClass.VOLTAGE),
-        s("battery_current", "Battery Current", UnitOfElectricCurrent.AMPERE, "battery", "current", SensorDeviceClass.CURRENT),
-        s("battery_power", "Battery Power", UnitOfPower.WATT, "battery", "power", SensorDeviceClass.POWER),
-        s("battery_soc", "Battery SOC", PERCENTAGE, "battery", "soc", SensorDeviceClass.BATTERY),
-        s("inverter_temperature", "Inverter Temperature", UnitOfTemperature.CELSIUS, "battery", "temperature", SensorDeviceClass.TEMPERATURE),
-        
-        # PV Sensors
-        s("pv_total_power", "PV Total Power", UnitOfPower.WATT, "pv", "total_power", SensorDeviceClass.POWER),
-        s("pv1_voltage", "PV1 Voltage", UnitOfElectricPotential.VOLT, "pv", "pv1_voltage", SensorDeviceClass.VOLTAGE),
-        s("pv1_current", "PV1 Current", UnitOfElectricCurrent.AMPERE, "pv", "pv1_current", SensorDeviceClass.CURRENT),
-        s("pv1_power", "PV1 Power", UnitOfPower.WATT, "pv", "pv1_power", SensorDeviceClass.POWER),
-        s("pv2_voltage", "PV2 Voltage", UnitOfElectricPotential.VOLT, "pv", "pv2_voltage", SensorDeviceClass.VOLTAGE),
-        s("pv2_current", "PV2 Current", UnitOfElectricCurrent.AMPERE, "pv", "pv2_current", SensorDeviceClass.CURRENT),
-        s("pv2_power", "PV2 Power", UnitOfPower.WATT, "pv", "pv2_power", SensorDeviceClass.POWER),
-
-        # Grid and Output Sensors
-        s("grid_voltage", "Grid Voltage", UnitOfElectricPotential.VOLT, "grid", "voltage", SensorDeviceClass.VOLTAGE),
-        s("grid_frequency", "Grid Frequency", UnitOfFrequency.HERTZ, "grid", "frequency", SensorDeviceClass.FREQUENCY, converter=lambda v: v / 100 if v is not None else None),
-        s("output_power", "Output Power", UnitOfPower.WATT, "output", "power", SensorDeviceClass.POWER),
-        s("output_apparent_power", "Output Apparent Power", UnitOfApparentPower.VOLT_AMPERE, "output", "apparent_power", SensorDeviceClass.APPARENT_POWER),
-        s("output_load_percentage", "Output Load", PERCENTAGE, "output", "load_percentage", icon="mdi:percent"),
-        
-        # System Status Sensors
-        s("operating_mode", "Operating Mode", None, "system", "mode_name", icon="mdi:power-settings"),
-        s("warnings", "Device Warnings", None, "system", "warnings", icon="mdi:alert-outline", converter=lambda v: ", ".join(v) if v else "None"),
-
-        # Rating Sensors (static data)
-        s("rating_battery_type", "Rating Battery Type", None, "rating", "battery_type", icon="mdi:car-battery"),
-        s("rating_max_charge_current", "Rating Max Charge Current", UnitOfElectricCurrent.AMPERE, "rating", "max_charging_current", SensorDeviceClass.CURRENT),
-        s("rating_max_ac_charge_current", "Rating Max AC Charge Current", UnitOfElectricCurrent.AMPERE, "rating", "max_ac_charging_current", SensorDeviceClass.CURRENT),
-        s("rating_output_priority", "Rating Output Priority", None, "rating", "output_source_priority", icon="mdi:source-commit"),
-        s("rating_charger_priority", "Rating Charger Priority", None, "rating", "charger_source_priority", icon="mdi:source-commit-next-local"),
-        s("rating_ac_output_voltage", "Rating AC Output Voltage", UnitOfElectricPotential.VOLT, "rating", "ac_output_rating_voltage", SensorDeviceClass.VOLTAGE),
-        s("rating_battery_float_v", "Rating Battery Float Voltage", UnitOfElectricPotential.VOLT, "rating", "battery_float_voltage", SensorDeviceClass.VOLTAGE),
-        s("rating_battery_bulk_v", "Rating Battery Bulk Voltage", UnitOfElectricPotential.VOLT, "rating", "battery_bulk_voltage", SensorDeviceClass.VOLTAGE),
-        s("rating_battery_recharge_v", "Rating Battery Recharge Voltage", UnitOfElectricPotential.VOLT, "rating", "battery_recharge_voltage", SensorDeviceClass.VOLTAGE),
-        s("rating_battery_under_v", "Rating Battery Under Voltage", UnitOfElectricPotential.VOLT, "rating", "battery_under_voltage", SensorDeviceClass.VOLTAGE),
-        s("rating_ac_output_power", "Rating AC Output Power", UnitOfPower.WATT, "rating", "ac_output_rating_active_power", SensorDeviceClass.POWER),
-    ]
-    
+
+    # Rating values (QPIRI) are static device configuration; when the
+    # inverter can fetch them on their own, poll them on a slow secondary
+    # coordinator instead of every live tick.
+    rating_coordinator = None
+    if hasattr(inverter, "get_rating_data"):
+        async def async_update_rating():
+            """Fetch the static rating data."""
+            try:
+                async with asyncio.timeout(UPDATE_TIMEOUT):
+                    return (await inverter.get_rating_data(),)
+            except TimeoutError as err:
+                raise UpdateFailed("Timed out waiting for rating data") from err
+            except Exception as err:
+                raise UpdateFailed(f"Error fetching rating data: {err}") from err
+
+        rating_coordinator = DataUpdateCoordinator(
+            hass, _LOGGER, name=f"easun_inverter_{config_entry.entry_id}_rating",
+            update_method=async_update_rating,
+            update_interval=RATING_UPDATE_INTERVAL,
+            always_update=False,
+        )
+        await rating_coordinator.async_refresh()
+
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = {
+        "coordinator": coordinator,
+        "rating_coordinator": rating_coordinator,
+        "inverter": inverter,
+    }
+
+    async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Re-arm the poll interval in place when options change.
+
+        Adjusting the interval on the live coordinator avoids a full entry
+        reload, which would destroy and recreate every entity just to pick
+        up a new number.
+        """
+        coordinator.update_interval = timedelta(
+            seconds=entry.options.get("scan_interval", 30)
+        )
+
+    config_entry.async_on_unload(config_entry.add_update_listener(_async_options_updated))
+
+    # All entities belong to the same device; build the registry dict once
+    # and share it by reference instead of allocating a copy per sensor.
+    model = config_entry.data.get("model")
+    device_info = {
+        "identifiers": frozenset({(DOMAIN, config_entry.entry_id)}),
+        "name": f"Easun Inverter ({model})",
+        "manufacturer": "Easun Power / Voltronic",
+        "model": model,
+    }
+
+    sensors_to_add = []
+    for id_suffix, name, unit, data_type, data_attr, device_class, state_class, icon, converter in SENSOR_SPECS:
+        if data_type == "rating" and rating_coordinator is not None:
+            sensor_coordinator, data_index = rating_coordinator, 0
+        else:
+            sensor_coordinator, data_index = coordinator, _DATA_INDEX[data_type]
+        sensors_to_add.append(
+            EasunSensor(sensor_coordinator, id_suffix, name, unit, data_attr,
+                        data_index, device_info, device_class, state_class,
+                        icon, converter)
+        )
+
+    def _register_dispatcher(coord, sensors) -> None:
+        """Register one batched update dispatcher for a coordinator.
+
+        One listener instead of one per entity collapses the per-poll
+        state-machine notifications into a single scheduled callback; the
+        dirty check skips writes for unchanged values. The per-sensor hot
+        callables are packed into a flat tuple table up front.
+        """
+        dispatch_table = tuple(
+            (sensor, sensor.update_value, sensor.async_write_ha_state)
+            for sensor in sensors
+        )
+
+        @callback
+        def _dispatch_coordinator_update() -> None:
+            for sensor, update_value, write_state in dispatch_table:
+                if sensor.hass is None:
+                    continue
+                if update_value():
+                    write_state()
+
+        config_entry.async_on_unload(coord.async_add_listener(_dispatch_coordinator_update))
+
+    _register_dispatcher(coordinator, [s for s in sensors_to_add if s.coordinator is coordinator])
+    if rating_coordinator is not None:
+        _register_dispatcher(
+            rating_coordinator,
+            [s for s in sensors_to_add if s.coordinator is rating_coordinator],
+        )
+
     add_entities(sensors_to_add)
 
 class EasunSensor(SensorEntity):
+    # Slots for the fields this class adds: the hot attributes read by
+    # update_value become C-level slot lookups instead of dict probes. The
+    # _attr_* values still land in the Entity-provided __dict__, so this is
+    # about access speed on the per-tick path more than memory.
+    __slots__ = (
+        "coordinator", "_id_suffix", "_data_attr", "_data_index",
+        "_accessor", "_attr_available",
+    )
+
     _attr_has_entity_name = True
     _attr_should_poll = False
 
-    def __init__(self, coordinator, id_suffix, name, unit, data_type, data_attr, data_index, device_class=None, icon=None, converter=None):
+    def __init__(self, coordinator, id_suffix, name, unit, data_attr, data_index, device_info, device_class=None, state_class=None, icon=None, converter=None):
         self.coordinator = coordinator
         self._id_suffix = id_suffix
         self._attr_name = name
         self._attr_native_unit_of_measurement = unit
-        self._data_type = data_type
         self._data_attr = data_attr
         self._data_index = data_index
-        self._value_converter = converter
+        # Precompute the value accessor once so the per-poll callback does a
+        # single call instead of a getattr plus converter dispatch per sensor.
+        # attrgetter resolves the attribute at C level; the data objects are
+        # dataclasses, so the attribute is always present.
+        getter = attrgetter(data_attr)
+        if converter is not None:
+            self._accessor = lambda obj, get=getter, conv=converter: conv(get(obj))
+        else:
+            self._accessor = getter
         self._attr_device_class = device_class
+        self._attr_state_class = state_class
         self._attr_icon = icon
+        self._attr_available = False
         self._attr_unique_id = f"easun_inverter_{self.coordinator.config_entry.entry_id}_{self._id_suffix}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, self.coordinator.config_entry.entry_id)},
-            "name": f"Easun Inverter ({self.coordinator.config_entry.data.get('model')})",
-            "manufacturer": "Easun Power / Voltronic",
-            "model": self.coordinator.config_entry.data.get('model'),
-        }
-
-    @property
-    def available(self) -> bool:
-        return (
-            self.coordinator.last_update_success and
-            self.coordinator.data is not None and
-            self._data_index is not None and
-            len(self.coordinator.data) > self._data_index and
-            self.coordinator.data[self._data_index] is not None
-        )
+        self._attr_device_info = device_info
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        if self.available:
-            data_obj = self.coordinator.data[self._data_index]
-            value = getattr(data_obj, self._data_attr, None)
-            if self._value_converter:
-                self._attr_native_value = self._value_converter(value)
-            else:
-                self._attr_native_value = value
-        else:
-            self._attr_native_value = None
-        self.async_write_ha_state()
+    def update_value(self) -> bool:
+        """Refresh the cached value and availability; return True on change.
+
+        Availability is computed here, once per coordinator tick, and
+        cached in _attr_available; state writes and template evaluations
+        then read a plain attribute instead of re-running the chain of
+        checks every time.
+        """
+        coordinator = self.coordinator
+        data = coordinator.data
+        idx = self._data_index
+        available = (
+            coordinator.last_update_success
+            and data is not None
+            and len(data) > idx
+            and data[idx] is not None
+        )
+        new_value = self._accessor(data[idx]) if available else None
+        if new_value == self._attr_native_value and available == self._attr_available:
+            return False
+        self._attr_native_value = new_value
+        self._attr_available = available
+        return True
 
     async def async_added_to_hass(self) -> None:
-        self.async_on_remove(self.coordinator.async_add_listener(self._handle_coordinator_update))
-        self._handle_coordinator_update()
+        # Updates arrive through the platform-level dispatcher; just seed the
+        # initial value before HA writes the first state.
+        self.update_value()
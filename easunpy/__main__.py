@@ -114,14 +114,14 @@ def create_dashboard(inverter_data: InverterData, status_message: str | Text = "
     if inverter_data.grid:
         grid_output_table.add_row("Grid Voltage", f"{inverter_data.grid.voltage:.1f}V")
         grid_output_table.add_row("Grid Power", f"{inverter_data.grid.power}W")
-        grid_output_table.add_row("Grid Frequency", f"{inverter_data.grid.frequency/100:.2f}Hz")
+        grid_output_table.add_row("Grid Frequency", f"{inverter_data.grid.frequency:.2f}Hz")
     
     if inverter_data.output:
         grid_output_table.add_row("Output Voltage", f"{inverter_data.output.voltage:.1f}V")
         grid_output_table.add_row("Output Current", f"{inverter_data.output.current:.1f}A")
         grid_output_table.add_row("Output Power", f"{inverter_data.output.power}W")
         grid_output_table.add_row("Output Load", f"{inverter_data.output.load_percentage}%")
-        grid_output_table.add_row("Output Frequency", f"{inverter_data.output.frequency/100:.1f}Hz")
+        grid_output_table.add_row("Output Frequency", f"{inverter_data.output.frequency:.1f}Hz")
 
     # Add timestamp and status with right alignment for status
     header = Table.grid(padding=(0, 1))
@@ -242,7 +242,7 @@ async def print_single_update(inverter_data: InverterData):
         if inverter_data.grid.power is not None:
             console.print(f"Power: {inverter_data.grid.power}W")
         if inverter_data.grid.frequency is not None:
-            console.print(f"Frequency: {inverter_data.grid.frequency/100:.2f}Hz")
+            console.print(f"Frequency: {inverter_data.grid.frequency:.2f}Hz")
 
     if inverter_data.output:
         console.print("\n[bold]Output Status")
@@ -255,7 +255,7 @@ async def print_single_update(inverter_data: InverterData):
         if inverter_data.output.load_percentage is not None:
             console.print(f"Load: {inverter_data.output.load_percentage}%")
         if inverter_data.output.frequency is not None:
-            console.print(f"Frequency: {inverter_data.output.frequency/100:.1f}Hz")
+            console.print(f"Frequency: {inverter_data.output.frequency:.1f}Hz")
 
 async def main():
     parser = argparse.ArgumentParser(description='Easun Inverter Monitor')
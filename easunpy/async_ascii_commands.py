@@ -1,54 +1,95 @@
 # easunpy/async_ascii_commands.py
 import logging
-from typing import Dict, Any, Optional, List
+import re
+from typing import Dict, Any, NamedTuple, Optional, List
 from .models import OperatingMode
 
 logger = logging.getLogger(__name__)
 
-def parse_qpgis(raw: str) -> Dict[str, Any]:
+# One compiled scan that captures exactly the QPIGS fields we use
+# (positions 0-16 and 19), instead of splitting the whole response into a
+# 21+ element list and indexing it. Groups line up with QPIGSData below.
+_QPIGS_RE = re.compile(
+    rb"\(?(\S+) (\S+) (\S+) (\S+) (\S+) (\S+) (\S+) (\S+) (\S+) (\S+) "
+    rb"(\S+) (\S+) (\S+) (\S+) (\S+) (\S+) (\S+) \S+ \S+ (\S+)"
+)
+
+class QPIGSData(NamedTuple):
+    """Typed view of a QPIGS response.
+
+    A NamedTuple instead of a dict: consumers read fields as C-level
+    index loads rather than hashing string keys, and the values are
+    converted to their final types exactly once, here.
+    """
+    grid_voltage: float
+    grid_frequency: float
+    output_voltage: float
+    output_frequency: float
+    output_apparent_power: int
+    output_power: int
+    output_load_percentage: int
+    bus_voltage: int
+    battery_voltage: float
+    battery_charging_current: int
+    battery_soc: int
+    inverter_temperature: int
+    pv1_input_current: float
+    pv1_input_voltage: float
+    battery_voltage_scc: float
+    battery_discharge_current: int
+    device_status: str
+    pv_charging_power: int
+
+def parse_qpgis(raw: bytes) -> Optional[QPIGSData]:
     """Parses the response from the QPIGS command."""
     try:
-        fields = raw.strip('(').split(' ')
-        if len(fields) < 21:
-            return {}
-        return {
-            'grid_voltage': float(fields[0]),
-            'grid_frequency': float(fields[1]),
-            'output_voltage': float(fields[2]),
-            'output_frequency': float(fields[3]),
-            'output_apparent_power': int(fields[4]),
-            'output_power': int(fields[5]),
-            'output_load_percentage': int(fields[6]),
-            'bus_voltage': int(fields[7]),
-            'battery_voltage': float(fields[8]),
-            'battery_charging_current': int(fields[9]),
-            'battery_soc': int(fields[10]),
-            'inverter_temperature': int(fields[11]),
-            'pv1_input_current': float(fields[12]),
-            'pv1_input_voltage': float(fields[13]),
-            'battery_voltage_scc': float(fields[14]),
-            'battery_discharge_current': int(fields[15]),
-            'device_status': fields[16],
-            'pv_charging_power': int(fields[19]),
-        }
-    except (ValueError, IndexError) as e:
+        match = _QPIGS_RE.match(raw)
+        if match is None:
+            return None
+        g = match.group
+        return QPIGSData(
+            grid_voltage=float(g(1)),
+            grid_frequency=float(g(2)),
+            output_voltage=float(g(3)),
+            output_frequency=float(g(4)),
+            output_apparent_power=int(g(5)),
+            output_power=int(g(6)),
+            output_load_percentage=int(g(7)),
+            bus_voltage=int(g(8)),
+            battery_voltage=float(g(9)),
+            battery_charging_current=int(g(10)),
+            battery_soc=int(g(11)),
+            inverter_temperature=int(g(12)),
+            pv1_input_current=float(g(13)),
+            pv1_input_voltage=float(g(14)),
+            battery_voltage_scc=float(g(15)),
+            battery_discharge_current=int(g(16)),
+            device_status=g(17).decode('ascii'),
+            pv_charging_power=int(g(18)),
+        )
+    except ValueError as e:
         logger.error(f"Failed to parse QPIGS response '{raw}': {e}")
-        return {}
+        return None
+
+_MODE_MAP = {
+    b'P': OperatingMode.POWER_ON, b'S': OperatingMode.STANDBY,
+    b'L': OperatingMode.LINE, b'B': OperatingMode.BATTERY,
+    b'F': OperatingMode.FAULT, b'H': OperatingMode.POWER_SAVING,
+}
 
-def parse_qmod(raw: str) -> Optional[OperatingMode]:
+def parse_qmod(raw: bytes) -> Optional[OperatingMode]:
     """Parses the response from the QMOD command."""
-    mode_char = raw.strip('(')
-    mode_map = {
-        'P': OperatingMode.POWER_ON, 'S': OperatingMode.STANDBY,
-        'L': OperatingMode.LINE, 'B': OperatingMode.BATTERY,
-        'F': OperatingMode.FAULT, 'H': OperatingMode.POWER_SAVING,
-    }
-    return mode_map.get(mode_char)
+    # The mode letter sits right after the optional '(' prefix; two fixed
+    # slices avoid the lstrip copy of the whole payload.
+    return _MODE_MAP.get(raw[1:2] if raw[:1] == b'(' else raw[:1])
 
-def parse_qpiri(raw: str) -> Dict[str, Any]:
+def parse_qpiri(raw: bytes) -> Dict[str, Any]:
     """Parses the response from the QPIRI command (Device Rating Information)."""
     try:
-        fields = raw.strip('(').split(' ')
+        # Cold path (rating data is polled rarely); decode once and reuse
+        # the existing string-keyed lookup tables.
+        s = raw.decode('ascii')
+        fields = (s[1:] if s[:1] == '(' else s).split()
         if len(fields) < 25:
             return {}
         
@@ -79,11 +120,11 @@ def parse_qpiri(raw: str) -> Dict[str, Any]:
         logger.error(f"Failed to parse QPIRI response '{raw}': {e}")
         return {}
 
-def parse_qpiws(raw: str) -> List[str]:
+def parse_qpiws(raw: bytes) -> List[str]:
     """Parses the response from the QPIWS command (Device Warning Status)."""
     warnings = []
     try:
-        bits = raw.strip('(')
+        bits = raw.lstrip(b'(')
         if len(bits) < 32: return ["Invalid response length"]
         
         warning_map = {
@@ -94,8 +135,9 @@ def parse_qpiws(raw: str) -> List[str]:
             13: "Battery low alarm", 15: "Battery under shutdown", 18: "Overload",
             19: "EEPROM fault", 22: "Power limit"
         }
+        one = ord('1')  # iterating bytes yields ints
         for i, bit in enumerate(bits):
-            if bit == '1' and i in warning_map:
+            if bit == one and i in warning_map:
                 warnings.append(warning_map[i])
 
     except Exception as e:
@@ -104,10 +146,10 @@ def parse_qpiws(raw: str) -> List[str]:
 
     return warnings if warnings else ["No warnings"]
 
-def parse_qpgis2(raw: str) -> Dict[str, Any]:
+def parse_qpgis2(raw: bytes) -> Dict[str, Any]:
     """Parses the response from the QPIGS2 command."""
     try:
-        fields = raw.strip('(').split(' ')
+        fields = (raw[1:] if raw[:1] == b'(' else raw).split()
         if len(fields) < 3: return {}
         return {
             'pv2_input_current': float(fields[0]),
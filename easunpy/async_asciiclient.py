@@ -3,12 +3,20 @@
 
 import asyncio
 import logging
+import socket
+import struct
 from typing import Optional
 
 from .crc_xmodem import crc16_xmodem, adjust_crc_byte
 
 logger = logging.getLogger(__name__)
 
+# Wrapper header: transaction id, protocol id, length, 0xFF, 0x04.
+_HEADER = struct.Struct('>HHHBB')
+# Cached length-field extractor; unpack_from reads straight out of the
+# header buffer without allocating an intermediate slice.
+_UNPACK_LEN = struct.Struct('>H').unpack_from
+
 class AsyncAsciiClient:
     """
     Handles the async communication with an ASCII-based inverter.
@@ -24,6 +32,10 @@ class AsyncAsciiClient:
         self._server_lock = asyncio.Lock()
         self._cmd_lock = asyncio.Lock()  # Lock to ensure sequential command execution
         self._transaction_id = 0x15a8
+        # Only a handful of distinct commands are ever sent, and everything
+        # but the transaction id is constant per command, so cache the fully
+        # framed packet (CRC included) and just splice the id in at send time.
+        self._packet_cache: dict[str, bytearray] = {}
 
     def is_connected(self) -> bool:
         """Check if the client is currently connected."""
@@ -39,6 +51,13 @@ class AsyncAsciiClient:
             
         peername = writer.get_extra_info('peername')
         logger.info(f"Inverter connected from {peername}")
+
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            # Keepalive lets the OS detect a silently dead inverter link
+            # between polls instead of us discovering it via a timeout.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
         self._reader = reader
         self._writer = writer
         self._connection_established.set()
@@ -58,6 +77,13 @@ class AsyncAsciiClient:
         Ensures the server is running and sends a discovery packet.
         This method is non-blocking and safe to call on every update.
         """
+        # Double-checked fast path: with the server up and the inverter
+        # connected there is nothing to do, so skip the lock round-trip and
+        # the discovery datagram entirely. The flag only flips inside the
+        # event loop, so the unlocked read is safe.
+        if self._server is not None and self.is_connected():
+            return
+
         async with self._server_lock:
             if self._server is None:
                 try:
@@ -70,70 +96,129 @@ class AsyncAsciiClient:
                     self._server = None
                     return
 
+        # The inverter may have connected while we were starting the server.
+        if self.is_connected():
+            return
+
         try:
             udp_message = f"set>server={self.local_ip}:{self.port};".encode('ascii')
-            loop = asyncio.get_event_loop()
-            transport, _ = await loop.create_datagram_endpoint(
-                lambda: asyncio.DatagramProtocol(),
-                remote_addr=(self.inverter_ip, 58899)
-            )
-            transport.sendto(udp_message)
-            transport.close()
+            # A plain non-blocking sendto: a single UDP datagram never
+            # needs a full asyncio datagram endpoint (transport creation,
+            # selector registration and teardown) per attempt.
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                sock.setblocking(False)
+                sock.sendto(udp_message, (self.inverter_ip, 58899))
+            finally:
+                sock.close()
             logger.debug(f"Sent discovery packet to {self.inverter_ip}:58899")
         except Exception as e:
             logger.error(f"Failed to send UDP discovery packet: {e}")
 
-    def _build_command_packet(self, command: str) -> bytes:
-        """Builds the command packet with wrapper and CRC."""
-        trans_id = self._transaction_id
-        self._transaction_id = (self._transaction_id + 1) & 0xFFFF
+    def _build_packet_template(self, command: str) -> bytearray:
+        """Builds the framed packet for a command, transaction id zeroed."""
         command_bytes = command.encode('ascii')
-        
+
         crc = crc16_xmodem(command_bytes)
         crc_high = adjust_crc_byte((crc >> 8) & 0xFF)
         crc_low = adjust_crc_byte(crc & 0xFF)
-        
+
         data = command_bytes + bytes([crc_high, crc_low, 0x0D])
-        length = len(data) + 2
-        
-        packet = bytearray([
-            (trans_id >> 8) & 0xFF, trans_id & 0xFF,
-            0x00, 0x01,
-            (length >> 8) & 0xFF, length & 0xFF,
-            0xFF, 0x04
-        ]) + data
-        
-        return bytes(packet)
-
-    async def send_command(self, command: str) -> str:
-        """Sends a command and returns the parsed ASCII response."""
+
+        # One C-level pack for the whole header instead of assembling a
+        # Python list of shifted bytes.
+        return bytearray(_HEADER.pack(0x0000, 0x0001, len(data) + 2, 0xFF, 0x04)) + data
+
+    def _build_command_packet(self, command: str) -> bytes:
+        """Returns the command packet with wrapper, CRC and a fresh transaction id."""
+        trans_id = self._transaction_id
+        self._transaction_id = (self._transaction_id + 1) & 0xFFFF
+
+        template = self._packet_cache.get(command)
+        if template is None:
+            template = self._build_packet_template(command)
+            self._packet_cache[command] = template
+
+        # The transaction id sits in the wrapper, outside the CRC-covered
+        # payload, so patching the first two bytes is safe.
+        template[0] = (trans_id >> 8) & 0xFF
+        template[1] = trans_id & 0xFF
+        return bytes(template)
+
+    async def send_command(self, command: str) -> bytes:
+        """Sends a command and returns the raw response payload.
+
+        The payload is returned as bytes; the per-command parsers decode
+        only what they actually need.
+        """
         if not self.is_connected() or self._writer is None or self._reader is None:
             raise ConnectionError("Cannot send command: Not connected.")
 
         # Ensure only one command is sent at a time
         async with self._cmd_lock:
             packet = self._build_command_packet(command)
-            logger.debug(f"Sending command '{command}': {packet.hex()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending command '%s': %s", command, packet.hex())
             
             try:
                 self._writer.write(packet)
                 await self._writer.drain()
 
                 header = await asyncio.wait_for(self._reader.readexactly(6), timeout=10)
-                length = int.from_bytes(header[4:6], 'big')
+                length = _UNPACK_LEN(header, 4)[0]
                 
                 response_data = await asyncio.wait_for(self._reader.readexactly(length), timeout=10)
                 
                 raw_data_bytes = response_data[2:-3]
-                parsed_response = raw_data_bytes.decode('ascii')
-                logger.debug(f"Parsed response for '{command}': {parsed_response}")
-                
-                return parsed_response
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Response for '%s': %s", command, raw_data_bytes)
+
+                return raw_data_bytes
             except (asyncio.TimeoutError, ConnectionResetError, BrokenPipeError) as e:
                 logger.error(f"Connection error during send_command for '{command}': {e}")
                 await self.disconnect()
                 raise
 
+    async def send_commands(self, commands) -> list:
+        """Sends several commands pipelined and returns their responses in order.
+
+        All framed packets are written back-to-back under a single lock
+        acquisition with one drain, then the responses are read
+        sequentially. Compared with issuing send_command per command this
+        saves a lock round-trip and a flush per command and lets the
+        inverter start on the next query while the previous response is in
+        flight.
+        """
+        if not self.is_connected() or self._writer is None or self._reader is None:
+            raise ConnectionError("Cannot send commands: Not connected.")
+
+        async with self._cmd_lock:
+            batch = b"".join(self._build_command_packet(command) for command in commands)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending pipelined commands %s: %s", commands, batch.hex())
+
+            try:
+                writer = self._writer
+                writer.write(batch)
+                await writer.drain()
+
+                # Bind the loop invariants once; the read loop then runs on
+                # LOAD_FAST locals instead of repeated attribute lookups.
+                readexactly = self._reader.readexactly
+                wait_for = asyncio.wait_for
+                responses = []
+                append = responses.append
+                for _ in commands:
+                    header = await wait_for(readexactly(6), timeout=10)
+                    length = _UNPACK_LEN(header, 4)[0]
+                    response_data = await wait_for(readexactly(length), timeout=10)
+                    append(response_data[2:-3])
+                return responses
+            except (asyncio.TimeoutError, ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError) as e:
+                logger.error(f"Connection error during pipelined send: {e}")
+                await self.disconnect()
+                raise
+
     async def disconnect(self):
         """Disconnects and cleans up resources."""
         async with self._server_lock:
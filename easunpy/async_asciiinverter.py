@@ -1,5 +1,5 @@
 # easunpy/async_asciiinverter.py
-import asyncio
+import dataclasses
 import logging
 from typing import Optional, Tuple
 
@@ -9,90 +9,132 @@ from .async_ascii_commands import parse_qpgis, parse_qmod, parse_qpiri, parse_qp
 
 logger = logging.getLogger(__name__)
 
+_RATING_FIELDS = frozenset(f.name for f in dataclasses.fields(RatingData))
+
 class AsyncAsciiInverter:
     """High-level class to interact with a Voltronic ASCII inverter."""
     def __init__(self, inverter_ip: str, local_ip: str):
         self.client = AsyncAsciiClient(inverter_ip=inverter_ip, local_ip=local_ip)
         self.model = "VOLTRONIC_ASCII"
+        # Raw responses from the previous live poll and the tuple built
+        # from them; identical responses skip parsing and reallocation.
+        self._last_raw: Optional[tuple] = None
+        self._last_result: Optional[tuple] = None
 
-    async def get_all_data(self) -> Tuple[Optional[BatteryData], Optional[PVData], Optional[GridData], Optional[OutputData], Optional[SystemStatus], Optional[RatingData]]:
-        """Fetches all data from the inverter by sending ASCII commands sequentially."""
+    async def get_live_data(self) -> Tuple[Optional[BatteryData], Optional[PVData], Optional[GridData], Optional[OutputData], Optional[SystemStatus], None]:
+        """Fetches the frequently-changing data (everything except QPIRI)."""
         await self.client.ensure_connection()
 
         if not self.client.is_connected():
             logger.info("Inverter is not connected yet. Waiting for connection.")
             return None, None, None, None, None, None
 
+        # Only the I/O can raise: the parsers signal failure by returning
+        # None/empty instead of throwing, so the guarded region stays
+        # tight and the parse/build path below runs without a handler.
         try:
-            # Run commands sequentially
-            qpgis_res = await self.client.send_command("QPIGS")
-            await asyncio.sleep(0.2)
-            qmod_res = await self.client.send_command("QMOD")
-            await asyncio.sleep(0.2)
-            qpiri_res = await self.client.send_command("QPIRI")
-            await asyncio.sleep(0.2)
-            qpiws_res = await self.client.send_command("QPIWS")
-            await asyncio.sleep(0.2)
-            
-            qpgis2_res = None
-            try:
-                qpgis2_res = await self.client.send_command("QPIGS2")
-            except Exception:
-                logger.info("Command QPIGS2 failed (this may be normal for single MPPT models).")
-
-            # Parse all responses
-            qpgis_data = parse_qpgis(qpgis_res)
-            op_mode = parse_qmod(qmod_res)
-            rating_data_dict = parse_qpiri(qpiri_res)
-            warnings = parse_qpiws(qpiws_res)
-            qpgis2_data = parse_qpgis2(qpgis2_res) if qpgis2_res else {}
-
-            if not qpgis_data or not rating_data_dict:
-                logger.warning("Failed to get essential data (QPIGS or QPIRI).")
-                return None, None, None, None, None, None
-
-            # Populate data classes
-            battery = BatteryData(
-                voltage=qpgis_data.get('battery_voltage', 0.0),
-                power=int(qpgis_data.get('battery_voltage', 0.0) * (qpgis_data.get('battery_charging_current', 0) - qpgis_data.get('battery_discharge_current', 0))),
-                current=float(qpgis_data.get('battery_charging_current', 0) - qpgis_data.get('battery_discharge_current', 0)),
-                soc=qpgis_data.get('battery_soc', 0),
-                temperature=qpgis_data.get('inverter_temperature', 0)
+            # Pipeline all queries in one batch: a single lock acquisition
+            # and drain, with the responses read back in order, instead of
+            # four separate write/flush round-trips. Single-MPPT models
+            # answer QPIGS2 with a NAK, which parses to an empty dict below.
+            qpgis_res, qmod_res, qpiws_res, qpgis2_res = await self.client.send_commands(
+                ("QPIGS", "QMOD", "QPIWS", "QPIGS2")
             )
+        except (OSError, TimeoutError, EOFError) as e:
+            # The client has already torn the connection down.
+            logger.error("Connection error polling ASCII inverter: %s", e)
+            return None, None, None, None, None, None
 
-            pv = PVData(
-                total_power=qpgis_data.get('pv_charging_power', 0) + qpgis2_data.get('pv2_charging_power', 0),
-                charging_power=qpgis_data.get('pv_charging_power', 0) + qpgis2_data.get('pv2_charging_power', 0),
-                charging_current=qpgis_data.get('pv1_input_current', 0.0) + qpgis2_data.get('pv2_input_current', 0.0),
-                temperature=qpgis_data.get('inverter_temperature', 0),
-                pv1_voltage=qpgis_data.get('pv1_input_voltage', 0.0),
-                pv1_current=qpgis_data.get('pv1_input_current', 0.0),
-                pv1_power=int(qpgis_data.get('pv1_input_voltage', 0.0) * qpgis_data.get('pv1_input_current', 0.0)),
-                pv2_voltage=qpgis2_data.get('pv2_input_voltage', 0.0),
-                pv2_current=qpgis2_data.get('pv2_input_current', 0.0),
-                pv2_power=qpgis2_data.get('pv2_charging_power', 0),
-                pv_generated_today=0.0, pv_generated_total=0.0,
-            )
-            
-            grid = GridData(voltage=qpgis_data.get('grid_voltage', 0.0), power=0, frequency=int(qpgis_data.get('grid_frequency', 0.0) * 100))
-            output = OutputData(
-                voltage=qpgis_data.get('output_voltage', 0.0), current=0.0,
-                power=qpgis_data.get('output_power', 0),
-                apparent_power=qpgis_data.get('output_apparent_power', 0),
-                load_percentage=qpgis_data.get('output_load_percentage', 0),
-                frequency=int(qpgis_data.get('output_frequency', 0.0) * 100),
-            )
-            status = SystemStatus(operating_mode=op_mode, mode_name=op_mode.name if op_mode else "UNKNOWN", warnings=warnings, inverter_time=None)
-            
-            # This was the point of failure. Ensure the dictionary is not empty before creating the object.
-            rating = RatingData(**rating_data_dict) if rating_data_dict else None
+        # Idle systems frequently return byte-identical responses; in
+        # that case the previously built dataclasses are still exact,
+        # so skip the parse and allocation work entirely.
+        raw_key = (qpgis_res, qmod_res, qpiws_res, qpgis2_res)
+        if raw_key == self._last_raw and self._last_result is not None:
+            return self._last_result
 
-            return battery, pv, grid, output, status, rating
+        # Parse all responses
+        q = parse_qpgis(qpgis_res)
+        op_mode = parse_qmod(qmod_res)
+        warnings = parse_qpiws(qpiws_res)
+        qpgis2_data = parse_qpgis2(qpgis2_res) if qpgis2_res else {}
 
-        except Exception as e:
-            logger.error(f"Error getting all data for ASCII inverter: {e}", exc_info=True)
-            await self.client.disconnect()
+        if q is None:
+            logger.warning("Failed to get essential data (QPIGS).")
             return None, None, None, None, None, None
+
+        # Populate data classes; the QPIGS fields are already typed, so
+        # derived values are computed once instead of re-coercing per use.
+        battery_current = q.battery_charging_current - q.battery_discharge_current
+        battery = BatteryData(
+            voltage=q.battery_voltage,
+            power=int(q.battery_voltage * battery_current),
+            current=float(battery_current),
+            soc=q.battery_soc,
+            temperature=q.inverter_temperature,
+        )
+
+        pv_power = q.pv_charging_power + qpgis2_data.get('pv2_charging_power', 0)
+        pv = PVData(
+            total_power=pv_power,
+            charging_power=pv_power,
+            charging_current=q.pv1_input_current + qpgis2_data.get('pv2_input_current', 0.0),
+            temperature=q.inverter_temperature,
+            pv1_voltage=q.pv1_input_voltage,
+            pv1_current=q.pv1_input_current,
+            pv1_power=int(q.pv1_input_voltage * q.pv1_input_current),
+            pv2_voltage=qpgis2_data.get('pv2_input_voltage', 0.0),
+            pv2_current=qpgis2_data.get('pv2_input_current', 0.0),
+            pv2_power=qpgis2_data.get('pv2_charging_power', 0),
+            pv_generated_today=0.0, pv_generated_total=0.0,
+        )
+
+        grid = GridData(voltage=q.grid_voltage, power=0, frequency=q.grid_frequency)
+        output = OutputData(
+            voltage=q.output_voltage, current=0.0,
+            power=q.output_power,
+            apparent_power=q.output_apparent_power,
+            load_percentage=q.output_load_percentage,
+            frequency=q.output_frequency,
+        )
+        status = SystemStatus(operating_mode=op_mode, mode_name=op_mode.name if op_mode else "UNKNOWN", warnings=warnings, inverter_time=None)
+
+        result = (battery, pv, grid, output, status, None)
+        self._last_raw = raw_key
+        self._last_result = result
+        return result
+
+
+    async def get_rating_data(self) -> Optional[RatingData]:
+        """Fetches only the static QPIRI rating data.
+
+        Rating values are device configuration that effectively never
+        changes, so callers can poll this far less often than the live data.
+        """
+        await self.client.ensure_connection()
+
+        if not self.client.is_connected():
+            logger.info("Inverter is not connected yet. Waiting for connection.")
+            return None
+
+        try:
+            qpiri_res = await self.client.send_command("QPIRI")
+        except (OSError, TimeoutError, EOFError) as e:
+            logger.error("Connection error fetching rating data: %s", e)
+            return None
+
+        rating_data_dict = parse_qpiri(qpiri_res)
+        if not rating_data_dict:
+            logger.warning("Failed to get rating data (QPIRI).")
+            return None
+        # parse_qpiri also reports grid rating fields that RatingData
+        # does not carry; keep only the known dataclass fields.
+        return RatingData(**{k: v for k, v in rating_data_dict.items() if k in _RATING_FIELDS})
+
+    async def get_all_data(self) -> Tuple[Optional[BatteryData], Optional[PVData], Optional[GridData], Optional[OutputData], Optional[SystemStatus], Optional[RatingData]]:
+        """Fetches all data from the inverter, including the rating data."""
+        battery, pv, grid, output, status, _ = await self.get_live_data()
+        rating = await self.get_rating_data()
+        return battery, pv, grid, output, status, rating
             
     async def update_model(self, model: str):
         logger.debug("Model update called for ASCII inverter; no action needed.")
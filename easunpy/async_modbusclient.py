@@ -16,15 +16,15 @@ class DiscoveryProtocol(asyncio.DatagramProtocol):
 
     def connection_made(self, transport):
         self.transport = transport
-        logger.debug(f"Sending UDP discovery message to {self.inverter_ip}:58899")
+        logger.debug("Sending UDP discovery message to %s:58899", self.inverter_ip)
         self.transport.sendto(self.message)
 
     def datagram_received(self, data, addr):
-        logger.info(f"Received response from {addr}")
+        logger.info("Received response from %s", addr)
         self.response_received.set_result(True)
 
     def error_received(self, exc):
-        logger.error(f"Error received: {exc}")
+        logger.error("Error received: %s", exc)
         self.response_received.set_result(False)
 
 class AsyncModbusClient:
@@ -41,7 +41,12 @@ class AsyncModbusClient:
         self._writer = None
         self._connection_established = False
         self._last_activity = 0
-        self._connection_timeout = 30  # Timeout in seconds before considering connection stale
+        # Seconds of inactivity before the connection is considered stale.
+        # Must comfortably exceed the poll interval, otherwise every poll
+        # tears the connection down and pays a full UDP discovery plus
+        # reconnect wait; a dead socket is caught by is_closing()/read
+        # errors regardless, so this only guards truly abandoned links.
+        self._connection_timeout = 300
 
     async def _cleanup_server(self):
         """Cleanup server and all active connections."""
@@ -55,7 +60,7 @@ class AsyncModbusClient:
                     else:
                         logger.debug("Connection already closed")
                 except Exception as e:
-                    logger.debug(f"Error closing connection: {e}")
+                    logger.debug("Error closing connection: %s", e)
                 finally:
                     self._active_connections.remove(writer)
 
@@ -69,11 +74,11 @@ class AsyncModbusClient:
                     else:
                         logger.debug("Server already closed")
                 except Exception as e:
-                    logger.debug(f"Error closing server: {e}")
+                    logger.debug("Error closing server: %s", e)
                 finally:
                     self._server = None
         except Exception as e:
-            logger.debug(f"Error during cleanup: {e}")
+            logger.debug("Error during cleanup: %s", e)
         finally:
             self._server = None
             self._active_connections.clear()
@@ -110,26 +115,26 @@ class AsyncModbusClient:
                 try:
                     await asyncio.wait_for(protocol.response_received, timeout=timeout)
                     result = protocol.response_received.result()
-                    print(f"UDP discovery result: {result}")
+                    logger.debug("UDP discovery result: %s", result)
                     if result:
                         self._consecutive_udp_failures = 0  # Reset on success
                         return True
                 except asyncio.TimeoutError:
-                    logger.warning(f"UDP discovery timeout (attempt {attempt + 1}, timeout={timeout}s)")
+                    logger.warning("UDP discovery timeout (attempt %d, timeout=%ds)", attempt + 1, timeout)
                 finally:
                     transport.close()
 
                 await asyncio.sleep(1)  # Short delay between attempts
             except Exception as e:
-                logger.error(f"UDP discovery error: {str(e)}")
+                logger.error("UDP discovery error: %s", e)
 
         self._consecutive_udp_failures += 1
-        logger.error(f"UDP discovery failed after all attempts (failure #{self._consecutive_udp_failures})")
+        logger.error("UDP discovery failed after all attempts (failure #%d)", self._consecutive_udp_failures)
         return False
 
     async def _ensure_connection(self) -> bool:
         """Ensure we have a valid connection, establish one if needed."""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Check if connection is stale
         if self._connection_established and (current_time - self._last_activity) > self._connection_timeout:
@@ -152,7 +157,7 @@ class AsyncModbusClient:
                     self._handle_client_connection,
                     self.local_ip, self.port
                 )
-                logger.info(f"Server started on {self.local_ip}:{self.port}")
+                logger.info("Server started on %s:%s", self.local_ip, self.port)
 
                 # Wait for connection with timeout
                 try:
@@ -163,7 +168,7 @@ class AsyncModbusClient:
                     return False
 
             except Exception as e:
-                logger.error(f"Error establishing connection: {e}")
+                logger.error("Error establishing connection: %s", e)
                 await self._cleanup_server()
                 return False
 
@@ -182,18 +187,45 @@ class AsyncModbusClient:
             await writer.wait_closed()
             return
 
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            # Keepalive lets the OS detect a silently dead inverter link
+            # between polls instead of us discovering it via a timeout.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Frames are far below the MTU; without NODELAY Nagle can sit
+            # on a request while waiting for the previous ACK.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
         self._reader = reader
         self._writer = writer
         self._connection_established = True
-        self._last_activity = time.time()
+        self._last_activity = time.monotonic()
         self._active_connections.add(writer)
         logger.info("Client connection established")
 
-    async def send_bulk(self, hex_commands: list[str], retry_count: int = 5) -> list[str]:
-        """Send multiple Modbus TCP commands using persistent connection."""
+    async def disconnect(self):
+        """Close the connection and the server (for integration unload)."""
+        await self._cleanup_server()
+
+    async def send_bulk(self, commands: list[bytes], retry_count: int = 5,
+                        read_timeout: float = 5.0,
+                        cleanup_on_timeout: bool = True) -> list[bytes]:
+        """Send multiple Modbus TCP commands using persistent connection.
+
+        All requests go out in a single write; the replies are then read
+        back as MBAP-framed messages in order. One syscall per batch on
+        the send side instead of a write/drain round-trip per command.
+
+        Scan probes of units that may legitimately never answer should
+        pass retry_count=1, a short read_timeout and
+        cleanup_on_timeout=False: an expected miss then returns [] fast
+        and keeps the session alive for the live poll instead of paying
+        a full teardown plus UDP rediscovery per silent unit. Frames are
+        matched to commands by transaction id, so the late reply of a
+        slow responder is discarded rather than attributed to the next
+        request on the same connection.
+        """
         async with self._lock:
-            responses = []
-            
             for attempt in range(retry_count):
                 try:
                     if not await self._ensure_connection():
@@ -203,49 +235,61 @@ class AsyncModbusClient:
                         await asyncio.sleep(1)
                         continue
 
-                    for command in hex_commands:
-                        try:
-                            if self._writer.is_closing():
-                                logger.warning("Connection closed while processing commands")
-                                self._connection_established = False
-                                break
-
-                            logger.debug(f"Sending command: {command}")
-                            command_bytes = bytes.fromhex(command)
-                            self._writer.write(command_bytes)
-                            await self._writer.drain()
-
-                            response = await asyncio.wait_for(self._reader.read(1024), timeout=5)
-                            if len(response) >= 6:
-                                expected_length = int.from_bytes(response[4:6], 'big') + 6
-                                while len(response) < expected_length:
-                                    chunk = await asyncio.wait_for(self._reader.read(1024), timeout=5)
-                                    if not chunk:
-                                        break
-                                    response += chunk
-
-                            logger.debug(f"Response: {response.hex()}")
-                            responses.append(response.hex())
-                            self._last_activity = time.time()
-                            await asyncio.sleep(0.1)
-
-                        except asyncio.TimeoutError:
-                            logger.error(f"Timeout reading response for command: {command}")
-                            self._connection_established = False
-                            break
-                        except Exception as e:
-                            logger.error(f"Error processing command {command}: {e}")
-                            self._connection_established = False
-                            break
-
-                    if len(responses) == len(hex_commands):
+                    if self._writer.is_closing():
+                        logger.warning("Connection closed before sending commands")
+                        self._connection_established = False
+                        await asyncio.sleep(1)
+                        continue
+
+                    batch = b"".join(commands)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Sending %d commands: %s", len(commands), batch.hex())
+                    self._writer.write(batch)
+                    await self._writer.drain()
+
+                    try:
+                        readexactly = self._reader.readexactly
+                        wait_for = asyncio.wait_for
+                        responses = []
+                        for command in commands:
+                            expected_tid = command[:2]
+                            while True:
+                                header = await wait_for(readexactly(6), timeout=read_timeout)
+                                length = int.from_bytes(header[4:6], 'big')
+                                body = await wait_for(readexactly(length), timeout=read_timeout)
+                                if header[:2] == expected_tid:
+                                    break
+                                # Late reply of a request that already timed
+                                # out (e.g. a slow scan probe); drop it and
+                                # keep reading for the expected frame.
+                                logger.debug("Discarding stale frame tid=%s", header[:2].hex())
+                            response = header + body
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("Response: %s", response.hex())
+                            responses.append(response)
+                        self._last_activity = time.monotonic()
                         return responses
+                    except asyncio.TimeoutError:
+                        if not cleanup_on_timeout:
+                            # Expected silence (scan probe of an absent
+                            # unit): report no data and keep the session
+                            # the live poll shares.
+                            logger.debug("Timeout reading bulk responses; keeping session")
+                            return []
+                        # A retry on the same connection could pick up the
+                        # late reply of this batch and desync the framing,
+                        # so start the next attempt from a fresh session.
+                        logger.error("Timeout reading bulk responses")
+                        await self._cleanup_server()
+                    except asyncio.IncompleteReadError:
+                        logger.error("Connection closed mid-response during bulk read")
+                        await self._cleanup_server()
 
                 except Exception as e:
-                    logger.error(f"Bulk send error: {e}")
+                    logger.error("Bulk send error: %s", e)
                     self._connection_established = False
                     await self._cleanup_server()
-                
+
                 await asyncio.sleep(1)
 
-            return [] 
\ No newline at end of file
+            return []
\ No newline at end of file
@@ -1,19 +1,33 @@
 # easunpy/crc_xmodem.py
 # Implements the CRC-16/XMODEM algorithm used by Voltronic ASCII-based inverters.
 
+def _build_crc_table() -> tuple:
+    """Precomputes the 256-entry CRC-16/XMODEM lookup table."""
+    table = []
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = (crc << 1) ^ 0x1021
+            else:
+                crc <<= 1
+        table.append(crc & 0xFFFF)
+    return tuple(table)
+
+_CRC_TABLE = _build_crc_table()
+
 def crc16_xmodem(data: bytes) -> int:
     """
     Calculates the CRC-16/XMODEM checksum.
+
+    Table-driven: one lookup per input byte instead of eight shift/xor
+    rounds, using the table built once at import.
     """
     crc = 0
+    table = _CRC_TABLE
     for byte in data:
-        crc ^= (byte << 8)
-        for _ in range(8):
-            if crc & 0x8000:
-                crc = (crc << 1) ^ 0x1021
-            else:
-                crc <<= 1
-    return crc & 0xFFFF
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ byte]
+    return crc
 
 def adjust_crc_byte(byte: int) -> int:
     """
@@ -14,19 +14,19 @@ class ISolar:
         """Read a sequence of registers."""
         try:
             request = create_request(0x0777, 0x0001, 0x01, 0x03, start_register, count)
-            logger.debug(f"Sending request for registers {start_register}-{start_register + count - 1}: {request}")
+            logger.debug("Sending request for registers %d-%d: %s", start_register, start_register + count - 1, request)
             
             response = self.client.send(request)
             if not response:
-                logger.warning(f"No response received for registers {start_register}-{start_register + count - 1}")
+                logger.warning("No response received for registers %d-%d", start_register, start_register + count - 1)
                 return []
             
-            logger.debug(f"Received response: {response}")
+            logger.debug("Received response: %s", response)
             decoded = decode_modbus_response(response, count, data_format)
-            logger.debug(f"Decoded values: {decoded}")
+            logger.debug("Decoded values: %s", decoded)
             return decoded
         except Exception as e:
-            logger.error(f"Error reading registers {start_register}-{start_register + count - 1}: {str(e)}")
+            logger.error("Error reading registers %d-%d: %s", start_register, start_register + count - 1, e)
             return []
 
     def get_battery_data(self) -> Optional[BatteryData]:
@@ -89,7 +89,7 @@ class ISolar:
         return GridData(
             voltage=values[0] / 10.0,
             power=values[2],
-            frequency=freq[0]  # Already in the correct format (5000 = 50.00Hz)
+            frequency=freq[0] / 100.0  # Register holds centi-hertz (5000 = 50.00Hz)
         )
 
     def get_output_data(self) -> Optional[OutputData]:
@@ -117,7 +117,7 @@ class ISolar:
             power=values[2],
             apparent_power=values[3],
             load_percentage=values[4],
-            frequency=freq[0]  # Already in the correct format (5000 = 50.00Hz)
+            frequency=freq[0] / 100.0  # Register holds centi-hertz (5000 = 50.00Hz)
         )
 
     def get_operating_mode(self) -> Optional[SystemStatus]:
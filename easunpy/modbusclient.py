@@ -5,6 +5,10 @@ import logging  # Import logging
 
 from easunpy.crc import crc16_modbus
 
+# Big-endian 16-bit field reader; unpack_from avoids the temporary slice
+# and endian-string parse that int.from_bytes(buf[a:b], 'big') pays.
+_U16_BE = struct.Struct('>H')
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -15,6 +19,61 @@ class ModbusClient:
         self.local_ip = local_ip
         self.port = port
         self.request_id = 0  # Add request ID counter
+        self._listener: socket.socket = None
+        self._client_sock: socket.socket = None
+        # Reusable receive buffer; responses are read into it with
+        # recv_into instead of concatenating speculative reads.
+        self._recv_buf = bytearray(4096)
+
+    def close(self):
+        """Close the accepted connection and the listener."""
+        for sock in (self._client_sock, self._listener):
+            if sock is not None:
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+        self._client_sock = None
+        self._listener = None
+
+    def _ensure_connection(self) -> bool:
+        """Reuse the accepted inverter connection, establishing it if needed.
+
+        UDP discovery, bind, listen and accept only run when there is no
+        live connection; afterwards every send reuses the same socket.
+        """
+        if self._client_sock is not None:
+            return True
+
+        if not self.send_udp_discovery():
+            logger.info("UDP discovery failed")
+            return False
+
+        tcp_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        tcp_server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        tcp_server.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+        try:
+            logger.debug(f"Binding to {self.local_ip}:{self.port}")
+            tcp_server.bind((self.local_ip, self.port))
+            tcp_server.listen(1)
+            tcp_server.settimeout(10)
+
+            logger.debug("Waiting for client connection...")
+            client_sock, addr = tcp_server.accept()
+            logger.info(f"Client connected from {addr}")
+            # Frames are far below the MTU: disable Nagle so requests go
+            # out immediately, and size the receive buffer so a whole
+            # response arrives in one recv.
+            client_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+        except Exception as e:
+            logger.error(f"Error establishing connection: {e}")
+            tcp_server.close()
+            return False
+
+        self._listener = tcp_server
+        self._client_sock = client_sock
+        return True
 
     def send_udp_discovery(self) -> bool:
         """Perform UDP discovery to initialize the inverter communication."""
@@ -32,64 +91,71 @@ class ModbusClient:
                 logger.error(f"Error sending UDP discovery message: {e}")
                 return False
 
-    def send(self, hex_command: str, retry_count: int = 2) -> str:
-        """Send a Modbus TCP command."""
-        command_bytes = bytes.fromhex(hex_command)
-        logger.info(f"Sending command: {hex_command}")
+    def send(self, command: bytes, retry_count: int = 2) -> bytes:
+        """Send a Modbus TCP command built by create_request."""
+        # Accept legacy hex strings from external callers.
+        command_bytes = bytes.fromhex(command) if isinstance(command, str) else command
+        logger.info(f"Sending command: {command_bytes.hex()}")
 
         for attempt in range(retry_count):
             logger.debug(f"Attempt {attempt + 1} of {retry_count}")
-            
-            if not self.send_udp_discovery():
-                logger.info("UDP discovery failed")
+
+            if not self._ensure_connection():
                 time.sleep(1)
                 continue
 
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as tcp_server:
-                tcp_server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                tcp_server.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
-                
-                try:
-                    # Attempt to bind to the local IP and port
-                    logger.debug(f"Binding to {self.local_ip}:{self.port}")
-                    tcp_server.bind((self.local_ip, self.port))
-                    tcp_server.listen(1)
-
-                    logger.debug("Waiting for client connection...")
-                    client_sock, addr = tcp_server.accept()
-                    logger.info(f"Client connected from {addr}")
-                    
-                    with client_sock:
-                        logger.debug("Sending command bytes...")
-                        client_sock.sendall(command_bytes)
-
-                        logger.debug("Waiting for response...")
-                        response = client_sock.recv(1024)
-                        
-                        if len(response) >= 6:
-                            expected_length = int.from_bytes(response[4:6], 'big') + 6
-                            
-                            while len(response) < expected_length:
-                                chunk = client_sock.recv(1024)
-                                if not chunk:
-                                    break
-                                response += chunk
-
-                        response_hex = response.hex()
-                        logger.info(f"Received response: {response_hex}")
-                        return response_hex
-
-                except socket.timeout:
-                    logger.info("Socket timeout")
-                    time.sleep(1)
-                    continue
-                except Exception as e:
-                    logger.error(f"Error: {str(e)}")
+            try:
+                logger.debug("Sending command bytes...")
+                self._client_sock.sendall(command_bytes)
+
+                logger.debug("Waiting for response...")
+                # Read the 6-byte MBAP header, size the rest of the read
+                # from its length field, and fill the shared buffer with
+                # recv_into: no per-chunk bytes concatenation and no
+                # speculative over-read past the frame.
+                buf = self._recv_buf
+                view = memoryview(buf)
+                received = 0
+                closed = False
+                while received < 6:
+                    n = self._client_sock.recv_into(view[received:6])
+                    if n == 0:
+                        closed = True
+                        break
+                    received += n
+                if closed:
+                    # Peer closed the connection; reconnect on retry.
+                    logger.info("Connection closed by inverter")
+                    self.close()
                     time.sleep(1)
                     continue
 
+                expected_length = _U16_BE.unpack_from(buf, 4)[0] + 6
+                if expected_length > len(buf):
+                    self._recv_buf = buf = bytearray(expected_length)
+                    buf[:received] = view[:received]
+                    view = memoryview(buf)
+                while received < expected_length:
+                    n = self._client_sock.recv_into(view[received:expected_length])
+                    if n == 0:
+                        break
+                    received += n
+
+                response = bytes(view[:received])
+                logger.info(f"Received response: {response.hex()}")
+                return response
+
+            except socket.timeout:
+                logger.info("Socket timeout")
+                self.close()
+                time.sleep(1)
+            except Exception as e:
+                logger.error(f"Error: {str(e)}")
+                self.close()
+                time.sleep(1)
+
         logger.info("All retry attempts failed")
-        return ""
+        return b""
 
 def run_single_request(inverter_ip: str, local_ip: str, request: str):
     """
@@ -99,96 +165,67 @@ def run_single_request(inverter_ip: str, local_ip: str, request: str):
     response = inverter.send(request)
     return response
 
+# Precompiled frame layouts: RTU body (unit, function, address, count),
+# MBAP header (transaction id, protocol id, length) and the CRC, which
+# Modbus RTU transmits low byte first.
+_RTU_BODY = struct.Struct('>BBHH')
+_MBAP = struct.Struct('>HHH')
+_CRC_LE = struct.Struct('<H')
+
 # Función para crear la solicitud completa
 def create_request(transaction_id: int, protocol_id: int, unit_id: int, function_code: int,
-                   register_address: int, register_offset: int) -> str:
+                   register_address: int, register_offset: int) -> bytes:
     """
     Create a Modbus command with the correct length and CRC for the RTU packet.
     """
-    # Construir el paquete RTU
-    rtu_packet = bytearray([
-        unit_id,
-        function_code,
-        (register_address >> 8) & 0xFF, register_address & 0xFF,
-        (register_offset >> 8) & 0xFF, register_offset & 0xFF
-    ])
-
-    # Calcular el CRC para el paquete RTU
-    crc = crc16_modbus(rtu_packet)
-    crc_low = crc & 0xFF
-    crc_high = (crc >> 8) & 0xFF
-
-    # Agregar CRC al paquete RTU
-    rtu_packet.extend([crc_low, crc_high])
-    
-    # Campo adicional `FF04`
-    rtu_packet = bytearray([0xFF, 0x04]) + rtu_packet
-    
-    # Calcular la longitud total (incluye solo RTU) + TCP
-    length = len(rtu_packet)
-    
-    # Construir el comando completo
-    command = bytearray([
-        (transaction_id >> 8) & 0xFF, transaction_id & 0xFF,  # Transaction ID
-        (protocol_id >> 8) & 0xFF, protocol_id & 0xFF,        # Protocol ID
-        (length >> 8) & 0xFF, length & 0xFF                  # Longitud
-    ]) + rtu_packet
-
-    return command.hex()
-
-def decode_modbus_response(response: str, register_count: int=1, data_format: str="Int"):
+    # RTU body plus CRC, then the `FF04` marker field the inverter expects.
+    rtu_packet = _RTU_BODY.pack(unit_id, function_code, register_address, register_offset)
+    rtu_packet = b'\xff\x04' + rtu_packet + _CRC_LE.pack(crc16_modbus(rtu_packet))
+
+    return _MBAP.pack(transaction_id, protocol_id, len(rtu_packet)) + rtu_packet
+
+def decode_modbus_response(response: bytes, register_count: int=1, data_format: str="Int"):
     """
-    Decodes a Modbus TCP response using the provided format.
-    :param request: Hexadecimal string of the Modbus request.
-    :param response: Hexadecimal string of the Modbus response.
-    :return: Dictionary with register addresses and their values.
+    Decodes a Modbus TCP response.
+    :param response: Raw bytes of the Modbus response frame.
+    :return: List of decoded register values.
     """
-    # Extract common fields from response
-    req_id = response[:8]
-    length_hex = response[8:12]
-    length = int(length_hex, 16)
-    
-    # Extract RTU payload
-    rtu_payload = response[12:12 + length * 2]
-
-    # Decode RTU Payload
-    extra_field = rtu_payload[:2]
-    device_address = rtu_payload[2:4]
-    function_code = rtu_payload[4:6]
-    num_data_bytes = int(rtu_payload[8:10], 16)
-    data_bytes = rtu_payload[10:10 + num_data_bytes * 2]
-    # Decode the register values and pair with addresses
-    values = []
-    for i, _ in enumerate(range(register_count)):
-        if data_format == "Int":
-            # Handle signed 16-bit integers
-            value = int(data_bytes[i * 4:(i + 1) * 4], 16)
-            # If the highest bit is set (value >= 32768), it's negative
-            if value >= 32768:  # 0x8000
-                value -= 65536  # 0x10000
-        elif data_format == "UnsignedInt":
-            # Handle unsigned 16-bit integers (0 to 65535)
-            value = int(data_bytes[i * 4:(i + 1) * 4], 16)
-        elif data_format == "Float":
-            value = struct.unpack('f', bytes.fromhex(data_bytes[i * 4:(i + 1) * 4]))[0]
-        else:
-            raise ValueError(f"Unsupported data format: {data_format}")
-        values.append(value)
-
-    return values
-
-def get_registers_from_request(request: str) -> list:
+    # Accept legacy hex strings from external callers.
+    if isinstance(response, str):
+        response = bytes.fromhex(response)
+
+    length = _U16_BE.unpack_from(response, 4)[0]
+
+    # RTU payload: FF 04 marker, unit id, function code, byte count, data.
+    rtu_payload = response[6:6 + length]
+    num_data_bytes = rtu_payload[4]
+    data_bytes = rtu_payload[5:5 + num_data_bytes]
+    # Decode all register words with a single C-level unpack instead of a
+    # per-register slice loop.
+    if data_format == "Int":
+        # Signed 16-bit integers
+        return list(struct.unpack(f">{register_count}h", data_bytes[:register_count * 2]))
+    if data_format == "UnsignedInt":
+        # Unsigned 16-bit integers (0 to 65535)
+        return list(struct.unpack(f">{register_count}H", data_bytes[:register_count * 2]))
+    if data_format == "Float":
+        return [
+            struct.unpack('f', data_bytes[i * 2:(i + 1) * 2])[0]
+            for i in range(register_count)
+        ]
+    raise ValueError(f"Unsupported data format: {data_format}")
+
+def get_registers_from_request(request: bytes) -> range:
     """
     Extracts register addresses from a Modbus request
-    :param request: Hexadecimal string of the Modbus request
-    :return: List of register addresses
+    :param request: Raw bytes of the Modbus request (or its hex form)
+    :return: Range of register addresses covered by the request
     """
-    rtu_payload = request[12:]  # Skip TCP header
-    register_address = int(rtu_payload[8:12], 16)  # Get register address from RTU payload
-    register_count = int(rtu_payload[12:16], 16)  # Get number of registers
-    
-    registers = []
-    for i in range(register_count):
-        registers.append(register_address + i)
-        
-    return registers
+    # Accept legacy hex strings from external callers.
+    if isinstance(request, str):
+        request = bytes.fromhex(request)
+    # Address and count sit at fixed offsets behind the MBAP header and
+    # the FF 04 marker; a range covers them without building a list.
+    register_address = _U16_BE.unpack_from(request, 10)[0]
+    register_count = _U16_BE.unpack_from(request, 12)[0]
+    return range(register_address, register_address + register_count)
@@ -2,9 +2,10 @@
 from dataclasses import dataclass, field
 from enum import Enum
 import datetime
+from types import MappingProxyType
 from typing import Dict, Optional, Callable, Any, List
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BatteryData:
     voltage: float
     current: float
@@ -12,7 +13,7 @@ class BatteryData:
     soc: int
     temperature: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PVData:
     total_power: int
     charging_power: int
@@ -27,22 +28,22 @@ class PVData:
     pv_generated_today: float
     pv_generated_total: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GridData:
     voltage: float
     power: int
-    frequency: int
+    frequency: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OutputData:
     voltage: float
     current: float
     power: int
     apparent_power: int
     load_percentage: int
-    frequency: int
+    frequency: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RatingData:
     """Holds static rating data from the QPIRI command."""
     ac_output_rating_voltage: float
@@ -66,7 +67,7 @@ class OperatingMode(Enum):
     POWER_ON = 10; STANDBY = 11; LINE = 12; BATTERY = 13; FAULT = 14; POWER_SAVING = 15
     UNKNOWN = 99
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemStatus:
     operating_mode: Optional[OperatingMode]
     mode_name: str
@@ -74,17 +75,21 @@ class SystemStatus:
     warnings: List[str] = field(default_factory=list) # Made optional with a default value
 
 # --- Below is for Modbus models, unchanged ---
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RegisterConfig:
     address: int
     scale_factor: float = 1.0
     processor: Optional[Callable[[int], Any]] = None
 
-@dataclass
+@dataclass(slots=True)
 class ModelConfig:
     name: str
     protocol: str = "modbus"
     register_map: Dict[str, RegisterConfig] = field(default_factory=dict)
+    # Largest hole (in registers) a read group may span. Wider gaps mean
+    # fewer Modbus round-trips at the cost of reading throwaway words;
+    # tune per model if its address map is unusually sparse or dense.
+    max_register_gap: int = 10
     
     def get_address(self, register_name: str) -> Optional[int]:
         config = self.register_map.get(register_name)
@@ -108,7 +113,7 @@ VOLTRONIC_ASCII = ModelConfig(name="VOLTRONIC_ASCII", protocol="ascii")
 ISOLAR_SMG_II_11K = ModelConfig(
     name="ISOLAR_SMG_II_11K",
     protocol="modbus",
-    register_map={
+    register_map=MappingProxyType({
         "operation_mode": RegisterConfig(201),
         "battery_voltage": RegisterConfig(277, 0.1),
         "battery_current": RegisterConfig(278, 0.1),
@@ -128,13 +133,13 @@ ISOLAR_SMG_II_11K = ModelConfig(
         "grid_voltage": RegisterConfig(338, 0.1),
         "grid_current": RegisterConfig(339, 0.1),
         "grid_power": RegisterConfig(340),
-        "grid_frequency": RegisterConfig(607),
+        "grid_frequency": RegisterConfig(607, 0.01),
         "output_voltage": RegisterConfig(346, 0.1),
         "output_current": RegisterConfig(347, 0.1),
         "output_power": RegisterConfig(348),
         "output_apparent_power": RegisterConfig(349),
         "output_load_percentage": RegisterConfig(350),
-        "output_frequency": RegisterConfig(607),
+        "output_frequency": RegisterConfig(607, 0.01),
         "time_register_0": RegisterConfig(696, processor=int),
         "time_register_1": RegisterConfig(697, processor=int),
         "time_register_2": RegisterConfig(698, processor=int),
@@ -143,13 +148,13 @@ ISOLAR_SMG_II_11K = ModelConfig(
         "time_register_5": RegisterConfig(701, processor=int),
         "pv_energy_today": RegisterConfig(702, 0.01),
         "pv_energy_total": RegisterConfig(703, 0.01),
-    }
+    })
 )
 
 ISOLAR_SMG_II_6K = ModelConfig(
     name="ISOLAR_SMG_II_6K",
     protocol="modbus",
-    register_map={
+    register_map=MappingProxyType({
         "operation_mode": RegisterConfig(201),
         "battery_voltage": RegisterConfig(215, 0.1),
         "battery_current": RegisterConfig(216, 0.1),
@@ -169,13 +174,13 @@ ISOLAR_SMG_II_6K = ModelConfig(
         "grid_voltage": RegisterConfig(202, 0.1),
         "grid_current": RegisterConfig(0),
         "grid_power": RegisterConfig(204),
-        "grid_frequency": RegisterConfig(203),
+        "grid_frequency": RegisterConfig(203, 0.01),
         "output_voltage": RegisterConfig(210, 0.1),
         "output_current": RegisterConfig(211, 0.1),
         "output_power": RegisterConfig(213),
         "output_apparent_power": RegisterConfig(214),
         "output_load_percentage": RegisterConfig(225, 0.01),
-        "output_frequency": RegisterConfig(212),
+        "output_frequency": RegisterConfig(212, 0.01),
         "time_register_0": RegisterConfig(696, processor=int),
         "time_register_1": RegisterConfig(697, processor=int),
         "time_register_2": RegisterConfig(698, processor=int),
@@ -184,11 +189,14 @@ ISOLAR_SMG_II_6K = ModelConfig(
         "time_register_5": RegisterConfig(701, processor=int),
         "pv_energy_today": RegisterConfig(0),
         "pv_energy_total": RegisterConfig(0),
-    }
+    })
 )
 
-MODEL_CONFIGS = {
+# Read-only views: the configs are shared module-level singletons that
+# several inverter instances (and HA worker threads) consult, so neither
+# the registry nor the register maps should be mutable at runtime.
+MODEL_CONFIGS = MappingProxyType({
     "VOLTRONIC_ASCII": VOLTRONIC_ASCII,
     "ISOLAR_SMG_II_11K": ISOLAR_SMG_II_11K,
     "ISOLAR_SMG_II_6K": ISOLAR_SMG_II_6K,
-}
+})
@@ -15,5 +15,6 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    # dataclass(slots=True) needs 3.10; asyncio.timeout needs 3.11.
+    python_requires='>=3.11',
 )